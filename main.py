@@ -1,138 +1,502 @@
-import subprocess
-import json, base64
 import sys
-import argparse
 import logging
 import getpass  # new import for default user
 import os  # new import for file size check
+import ctypes
+import functools
+import atexit
+import time
 
 # Setup basic logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+log = logging.getLogger(__name__)
+
+# json, orjson, base64 and argparse are imported where they are used to keep CLI start-up short
+@functools.lru_cache(maxsize=1)
+def _orjson():
+    # Optional: faster JSON parsing/serialization (pip install secure_config[fast])
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+# orjson must give exactly the stdlib's result: anything it rejects (BOM, NaN/Infinity, out-of-range
+# numbers) is retried with json, and payloads with 19+ digit runs, which may hold integers beyond
+# 64 bits that orjson would turn into floats, go straight to json.
+def _json_loads(data):
+    orjson = _orjson()
+    if orjson is not None:
+        import re
+        if not re.search(rb"\d{19}", data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    import json
+    return json.loads(data)
+
+# Output always uses json: orjson prints NaN/Infinity as null and differs in escaping and float formatting
+def _json_dumps(obj, pretty=True):
+    import json
+    return json.dumps(obj, indent=2) if pretty else json.dumps(obj, separators=(",", ":"))
+
+# Security.framework status codes and CoreFoundation constants (macOS only)
+errSecDuplicateItem = -25299
+errSecItemNotFound = -25300
+kCFStringEncodingUTF8 = 0x08000100
+
+# list results keyed by (path, mtime, size) of the default keychain file, reused for up to _CACHE_INTERVAL seconds
+_LIST_CACHE = {}
+_CACHE_INTERVAL = 300
+
+class KeychainError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+@functools.lru_cache(maxsize=1)
+def _frameworks():
+    # Load CoreFoundation/Security once per process and declare the signatures we call
+    cf = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
+    sec = ctypes.CDLL("/System/Library/Frameworks/Security.framework/Security")
+
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    cf.CFRelease.restype = None
+    cf.CFStringGetLength.argtypes = [ctypes.c_void_p]
+    cf.CFStringGetLength.restype = ctypes.c_long
+    cf.CFStringGetMaximumSizeForEncoding.argtypes = [ctypes.c_long, ctypes.c_uint32]
+    cf.CFStringGetMaximumSizeForEncoding.restype = ctypes.c_long
+    cf.CFStringGetCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+    cf.CFStringGetCString.restype = ctypes.c_bool
+
+    cf.CFGetTypeID.argtypes = [ctypes.c_void_p]
+    cf.CFGetTypeID.restype = ctypes.c_ulong
+    cf.CFStringGetTypeID.argtypes = []
+    cf.CFStringGetTypeID.restype = ctypes.c_ulong
+    cf.CFDictionaryCreate.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_void_p),
+        ctypes.c_long, ctypes.c_void_p, ctypes.c_void_p,
+    ]
+    cf.CFDictionaryCreate.restype = ctypes.c_void_p
+    cf.CFDictionaryGetValue.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    cf.CFDictionaryGetValue.restype = ctypes.c_void_p
+    cf.CFArrayGetCount.argtypes = [ctypes.c_void_p]
+    cf.CFArrayGetCount.restype = ctypes.c_long
+    cf.CFArrayGetValueAtIndex.argtypes = [ctypes.c_void_p, ctypes.c_long]
+    cf.CFArrayGetValueAtIndex.restype = ctypes.c_void_p
+
+    sec.SecKeychainCopyDefault.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    sec.SecKeychainCopyDefault.restype = ctypes.c_int32
+    sec.SecKeychainGetPath.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32), ctypes.c_char_p]
+    sec.SecKeychainGetPath.restype = ctypes.c_int32
+    sec.SecKeychainUnlock.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_bool]
+    sec.SecKeychainUnlock.restype = ctypes.c_int32
+    cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+    cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+    cf.CFArrayCreate.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p), ctypes.c_long, ctypes.c_void_p]
+    cf.CFArrayCreate.restype = ctypes.c_void_p
+
+    sec.SecKeychainItemCopyContent.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_void_p),
+    ]
+    sec.SecKeychainItemCopyContent.restype = ctypes.c_int32
+    sec.SecAccessCreate.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+    sec.SecAccessCreate.restype = ctypes.c_int32
+    sec.SecKeychainItemSetAccess.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    sec.SecKeychainItemSetAccess.restype = ctypes.c_int32
+    sec.SecItemCopyMatching.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+    sec.SecItemCopyMatching.restype = ctypes.c_int32
+    sec.SecCopyErrorMessageString.argtypes = [ctypes.c_int32, ctypes.c_void_p]
+    sec.SecCopyErrorMessageString.restype = ctypes.c_void_p
+    sec.SecKeychainFindGenericPassword.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_uint32, ctypes.c_char_p,
+        ctypes.c_uint32, ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_void_p),
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+    sec.SecKeychainFindGenericPassword.restype = ctypes.c_int32
+    sec.SecKeychainAddGenericPassword.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_uint32, ctypes.c_char_p,
+        ctypes.c_uint32, ctypes.c_char_p,
+        ctypes.c_uint32, ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+    sec.SecKeychainAddGenericPassword.restype = ctypes.c_int32
+    sec.SecKeychainItemModifyAttributesAndData.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32, ctypes.c_char_p]
+    sec.SecKeychainItemModifyAttributesAndData.restype = ctypes.c_int32
+    sec.SecKeychainItemDelete.argtypes = [ctypes.c_void_p]
+    sec.SecKeychainItemDelete.restype = ctypes.c_int32
+    sec.SecKeychainItemFreeContent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    sec.SecKeychainItemFreeContent.restype = ctypes.c_int32
+    return cf, sec
+
+@functools.lru_cache(maxsize=None)
+def _constant(name):
+    # CFTypeRef globals exported by the frameworks (kSecClass, kCFBooleanTrue, ...)
+    cf, sec = _frameworks()
+    return ctypes.c_void_p.in_dll(cf if name.startswith("kCF") else sec, name).value
+
+def _cfdict(pairs):
+    cf, _ = _frameworks()
+    keys = (ctypes.c_void_p * len(pairs))(*[key for key, _ in pairs])
+    values = (ctypes.c_void_p * len(pairs))(*[value for _, value in pairs])
+    return cf.CFDictionaryCreate(
+        None, keys, values, len(pairs),
+        ctypes.addressof(ctypes.c_byte.in_dll(cf, "kCFTypeDictionaryKeyCallBacks")),
+        ctypes.addressof(ctypes.c_byte.in_dll(cf, "kCFTypeDictionaryValueCallBacks")),
+    )
+
+def _cfdict_str(d, key):
+    cf, _ = _frameworks()
+    value = cf.CFDictionaryGetValue(d, _constant(key))
+    if not value or cf.CFGetTypeID(value) != cf.CFStringGetTypeID():
+        return None
+    return _cfstring_to_str(value)
+
+def _cfstr(value):
+    # Caller must CFRelease the returned CFStringRef
+    cf, _ = _frameworks()
+    return cf.CFStringCreateWithCString(None, value.encode(), kCFStringEncodingUTF8)
+
+def _cfstring_to_str(ref):
+    cf, _ = _frameworks()
+    size = cf.CFStringGetMaximumSizeForEncoding(cf.CFStringGetLength(ref), kCFStringEncodingUTF8) + 1
+    buf = ctypes.create_string_buffer(size)
+    if not cf.CFStringGetCString(ref, buf, size, kCFStringEncodingUTF8):
+        return ""
+    return buf.value.decode("utf-8")
+
+def _check(status):
+    if status == 0:
+        return
+    cf, sec = _frameworks()
+    message = sec.SecCopyErrorMessageString(status, None)
+    if not message:
+        raise KeychainError(status, f"OSStatus {status}")
+    try:
+        raise KeychainError(status, _cfstring_to_str(message))
+    finally:
+        cf.CFRelease(message)
+
+@functools.lru_cache(maxsize=1)
+def _keychain():
+    # Default keychain, unlocked once and shared by every call so the user is prompted at most once per process.
+    # Every lookup (find, add, SecItemCopyMatching via _search_list) is scoped to it, so list/load/delete agree.
+    cf, sec = _frameworks()
+    ref = ctypes.c_void_p()
+    _check(sec.SecKeychainCopyDefault(ctypes.byref(ref)))
+    try:
+        _check(sec.SecKeychainUnlock(ref, 0, None, False))
+    except KeychainError:
+        cf.CFRelease(ref)
+        raise
+    atexit.register(cf.CFRelease, ref)
+    return ref
+
+def _search_list():
+    # kSecMatchSearchList value restricting SecItemCopyMatching to _keychain(); caller must CFRelease it
+    cf, _ = _frameworks()
+    keychains = (ctypes.c_void_p * 1)(_keychain())
+    return cf.CFArrayCreate(None, keychains, 1, ctypes.addressof(ctypes.c_byte.in_dll(cf, "kCFTypeArrayCallBacks")))
+
+def _keychain_item(ACCOUNT_NAME, SERVICE_NAME):
+    # Returns a SecKeychainItemRef without reading the secret; caller must CFRelease it
+    _, sec = _frameworks()
+    service = f"SC-{SERVICE_NAME}".encode()
+    account = ACCOUNT_NAME.encode()
+    item = ctypes.c_void_p()
+    _check(sec.SecKeychainFindGenericPassword(
+        _keychain(), len(service), service, len(account), account, None, None, ctypes.byref(item)))
+    return item
+
+def _keychain_read(ACCOUNT_NAME, SERVICE_NAME):
+    _, sec = _frameworks()
+    service = f"SC-{SERVICE_NAME}".encode()
+    account = ACCOUNT_NAME.encode()
+    length = ctypes.c_uint32()
+    data = ctypes.c_void_p()
+    _check(sec.SecKeychainFindGenericPassword(
+        _keychain(), len(service), service, len(account), account, ctypes.byref(length), ctypes.byref(data), None))
+    try:
+        return ctypes.string_at(data, length.value)
+    finally:
+        sec.SecKeychainItemFreeContent(None, data)
+
+def _keychain_write(ACCOUNT_NAME, SERVICE_NAME, data):
+    cf, sec = _frameworks()
+    service = f"SC-{SERVICE_NAME}".encode()
+    account = ACCOUNT_NAME.encode()
+    _LIST_CACHE.clear()
+    item = ctypes.c_void_p()
+    status = sec.SecKeychainAddGenericPassword(
+        _keychain(), len(service), service, len(account), account, len(data), data, ctypes.byref(item))
+    if status == errSecDuplicateItem:
+        item = _keychain_item(ACCOUNT_NAME, SERVICE_NAME)
+    else:
+        _check(status)
+    try:
+        if status == errSecDuplicateItem:
+            # Item already exists (equivalent of `security add-generic-password -U`): update its data in place
+            _check(sec.SecKeychainItemModifyAttributesAndData(item, None, len(data), data))
+        # Ensure 0 apps are trusted: replace the default ACL, which trusts the creating process
+        _set_no_trusted_apps(item, f"SC-{SERVICE_NAME}")
+    finally:
+        cf.CFRelease(item)
+
+def _set_no_trusted_apps(item, label):
+    cf, sec = _frameworks()
+    descriptor = _cfstr(label)
+    trusted = cf.CFArrayCreate(None, None, 0, ctypes.addressof(ctypes.c_byte.in_dll(cf, "kCFTypeArrayCallBacks")))
+    access = ctypes.c_void_p()
+    try:
+        _check(sec.SecAccessCreate(descriptor, trusted, ctypes.byref(access)))
+    finally:
+        cf.CFRelease(trusted)
+        cf.CFRelease(descriptor)
+    try:
+        _check(sec.SecKeychainItemSetAccess(item, access))
+    finally:
+        cf.CFRelease(access)
+
+def _keychain_delete(ACCOUNT_NAME, SERVICE_NAME):
+    cf, sec = _frameworks()
+    _LIST_CACHE.clear()
+    item = _keychain_item(ACCOUNT_NAME, SERVICE_NAME)
+    try:
+        _check(sec.SecKeychainItemDelete(item))
+    finally:
+        cf.CFRelease(item)
+
+def _keychain_attributes():
+    # Single SecItemCopyMatching round-trip; yields (service, account) of every generic password in _keychain()
+    cf, sec = _frameworks()
+    search_list = _search_list()
+    try:
+        query = _cfdict([
+            (_constant("kSecClass"), _constant("kSecClassGenericPassword")),
+            (_constant("kSecMatchSearchList"), search_list),
+            (_constant("kSecMatchLimit"), _constant("kSecMatchLimitAll")),
+            (_constant("kSecReturnAttributes"), _constant("kCFBooleanTrue")),
+        ])
+    finally:
+        cf.CFRelease(search_list)
+    result = ctypes.c_void_p()
+    try:
+        status = sec.SecItemCopyMatching(query, ctypes.byref(result))
+    finally:
+        cf.CFRelease(query)
+    if status == errSecItemNotFound:
+        return
+    _check(status)
+    try:
+        for i in range(cf.CFArrayGetCount(result)):
+            attributes = cf.CFArrayGetValueAtIndex(result, i)
+            service = _cfdict_str(attributes, "kSecAttrService")
+            account = _cfdict_str(attributes, "kSecAttrAccount")
+            if service and account:
+                yield service, account
+    finally:
+        cf.CFRelease(result)
+
+def _keychain_read_many(ACCOUNT_NAME, SERVICE_NAMES):
+    # One SecItemCopyMatching for all of the account's items, then read the data of the requested ones.
+    # kSecReturnData cannot be combined with kSecMatchLimitAll on file-based keychains, so refs are returned instead.
+    cf, sec = _frameworks()
+    wanted = {f"SC-{name}": name for name in SERVICE_NAMES}
+    account = _cfstr(ACCOUNT_NAME)
+    search_list = _search_list()
+    try:
+        query = _cfdict([
+            (_constant("kSecClass"), _constant("kSecClassGenericPassword")),
+            (_constant("kSecMatchSearchList"), search_list),
+            (_constant("kSecAttrAccount"), account),
+            (_constant("kSecMatchLimit"), _constant("kSecMatchLimitAll")),
+            (_constant("kSecReturnAttributes"), _constant("kCFBooleanTrue")),
+            (_constant("kSecReturnRef"), _constant("kCFBooleanTrue")),
+        ])
+    finally:
+        cf.CFRelease(search_list)
+        cf.CFRelease(account)
+    result = ctypes.c_void_p()
+    try:
+        status = sec.SecItemCopyMatching(query, ctypes.byref(result))
+    finally:
+        cf.CFRelease(query)
+    found = {}
+    if status != errSecItemNotFound:
+        _check(status)
+        try:
+            for i in range(cf.CFArrayGetCount(result)):
+                attributes = cf.CFArrayGetValueAtIndex(result, i)
+                name = wanted.get(_cfdict_str(attributes, "kSecAttrService"))
+                if name is None or name in found:
+                    continue
+                item = cf.CFDictionaryGetValue(attributes, _constant("kSecValueRef"))
+                length = ctypes.c_uint32()
+                data = ctypes.c_void_p()
+                _check(sec.SecKeychainItemCopyContent(item, None, None, ctypes.byref(length), ctypes.byref(data)))
+                try:
+                    found[name] = ctypes.string_at(data, length.value)
+                finally:
+                    sec.SecKeychainItemFreeContent(None, data)
+        finally:
+            cf.CFRelease(result)
+    missing = [name for name in SERVICE_NAMES if name not in found]
+    if missing:
+        raise KeychainError(errSecItemNotFound, f"No secret found for {ACCOUNT_NAME}/{', '.join(missing)}")
+    return found
+
+def _keychain_stamp():
+    # Identifies the state of the file backing _keychain(), which is the only keychain list queries
+    _, sec = _frameworks()
+    length = ctypes.c_uint32(1024)
+    path = ctypes.create_string_buffer(length.value)
+    _check(sec.SecKeychainGetPath(_keychain(), ctypes.byref(length), path))
+    try:
+        st = os.stat(path.value)
+    except OSError:
+        return None
+    return (path.value, st.st_mtime_ns, st.st_size)
+
+def _parse_payload(data):
+    # Returns (json_bytes, config). Newer items hold the raw JSON bytes; items stored by older versions
+    # hold base64-encoded JSON, so that is only tried once the payload fails to parse as JSON.
+    try:
+        return data, _json_loads(data)
+    except ValueError as e:
+        import base64, binascii
+        try:
+            decoded = base64.b64decode(data, validate=True)
+        except binascii.Error:
+            raise e from None
+        return decoded, _json_loads(decoded)
 
 def load_secure_config(ACCOUNT_NAME, SERVICE_NAME, store=False, filename="config.json"):
     if sys.platform == "darwin":
         try:
-            result = subprocess.run(
-                ["security", "find-generic-password", "-a", ACCOUNT_NAME, "-s", f"SC-{SERVICE_NAME}", "-w"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            config_json_str = base64.b64decode(result.stdout.strip())
-            if store:
-                with open("config.json", "w") as f:
-                    f.write(config_json_str.decode())
-                logging.info("Secrets stored in config.json")
-            return json.loads(config_json_str)
-        except subprocess.CalledProcessError as e:
-            logging.error("Failed to retrieve configuration: %s", e.stderr.strip())
+            payload = _keychain_read(ACCOUNT_NAME, SERVICE_NAME)
+        except KeychainError as e:
+            log.error("Failed to retrieve configuration: %s", e)
             sys.exit(1)
-        except json.JSONDecodeError as e:
-            logging.error("Invalid JSON retrieved from Keychain: %s", e)
+        try:
+            config_json_bytes, config = _parse_payload(payload)
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
+            log.error("Invalid JSON retrieved from Keychain: %s", e)
             sys.exit(1)
+        if store:
+            try:
+                with open(filename, "wb") as f:
+                    f.write(config_json_bytes)
+            except (OSError, ValueError) as e:
+                log.error("Failed to store secrets in %s: %s", filename, e)
+                sys.exit(1)
+            log.info("Secrets stored in %s", filename)
+        return config
     else:
         try:
             if not filename:
                 raise ValueError("Filename parameter must be provided for Linux environment.")
-            with open(filename, "r") as f:
-                config_json_str = f.read()
-            return json.loads(config_json_str)
+            with open(filename, "rb") as f:
+                return _json_loads(f.read())
         except Exception as e:
-            logging.error("Error loading configuration: %s", e)
+            log.error("Error loading configuration: %s", e)
+            sys.exit(1)
+
+def load_secure_configs(ACCOUNT_NAME, SERVICE_NAMES):
+    if sys.platform == "darwin":
+        try:
+            payloads = _keychain_read_many(ACCOUNT_NAME, SERVICE_NAMES)
+            return {name: _parse_payload(data)[1] for name, data in payloads.items()}
+        except KeychainError as e:
+            log.error("Failed to retrieve configuration: %s", e)
             sys.exit(1)
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
+            log.error("Invalid JSON retrieved from Keychain: %s", e)
+            sys.exit(1)
+    else:
+        log.error("Loading multiple configurations is only supported on macOS.")
+        sys.exit(1)
 
 def store_secure_config(ACCOUNT_NAME, SERVICE_NAME, filename):
     try:
         # Check file size
         if os.path.getsize(filename) > 31 * 1024:  # 31 KB
-            logging.error("File size is too large. Maximum allowed size is 31 KB.")
+            log.error("File size is too large. Maximum allowed size is 31 KB.")
             sys.exit(1)
 
-        with open(filename, "r") as f:
-            config_json_str = f.read()
-
-        encoded_config = base64.b64encode(config_json_str.encode()).decode().strip()
-        result = subprocess.run(
-            ["security", "add-generic-password", "-a", ACCOUNT_NAME, "-s", f"SC-{SERVICE_NAME}", "-w", encoded_config, "-U"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logging.info("Secrets updated: %s -> %s/%s", filename, ACCOUNT_NAME, SERVICE_NAME)
-        # Ensure 0 apps are trusted by setting an empty partition list
-        subprocess.run(
-            ["security", "set-generic-password-partition-list", "-S", "", "-a", ACCOUNT_NAME, "-s", f"SC-{SERVICE_NAME}"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-    except subprocess.CalledProcessError as e:
-        logging.error("Failed to store configuration: %s", e.stderr.strip())
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        logging.error("Invalid JSON retrieved from Keychain: %s", e)
+        with open(filename, "rb") as f:
+            config_json_bytes = f.read()
+        try:
+            _json_loads(config_json_bytes)
+        except ValueError as e:
+            log.error("Invalid JSON in %s: %s", filename, e)
+            sys.exit(1)
+
+        _keychain_write(ACCOUNT_NAME, SERVICE_NAME, config_json_bytes)
+        log.info("Secrets updated: %s -> %s/%s", filename, ACCOUNT_NAME, SERVICE_NAME)
+
+    except KeychainError as e:
+        log.error("Failed to store configuration: %s", e)
         sys.exit(1)
 
 def delete_secure_config(ACCOUNT_NAME, SERVICE_NAME):
     if sys.platform == "darwin":
         try:
-            result = subprocess.run(
-                ["security", "delete-generic-password", "-a", ACCOUNT_NAME, "-s", f"SC-{SERVICE_NAME}"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            logging.info("Secret deleted: %s/%s", ACCOUNT_NAME, SERVICE_NAME)
-        except subprocess.CalledProcessError as e:
-            logging.error("Failed to delete secret: %s", e.stderr.strip())
+            _keychain_delete(ACCOUNT_NAME, SERVICE_NAME)
+            log.info("Secret deleted: %s/%s", ACCOUNT_NAME, SERVICE_NAME)
+        except KeychainError as e:
+            log.error("Failed to delete secret: %s", e)
             sys.exit(1)
     else:
-        logging.error("Deleting secrets is only supported on macOS.")
+        log.error("Deleting secrets is only supported on macOS.")
         sys.exit(1)
 
 def list_generic_passwords(service_filter=None):
     if sys.platform == "darwin":
         try:
-            keychain_dump = subprocess.run(
-                ["security", "dump-keychain"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            passwords = []
-            current_service = None
-            current_account = None
-
-            for line in keychain_dump.stdout.splitlines():
-                line = line.strip()
-                if line.startswith('"svce"'):
-                    current_service = line.split('<blob>=')[1].strip(' "')
-                elif line.startswith('"acct"'):
-                    current_account = line.split('<blob>=')[1].strip(' "')
-
-                if current_service and current_account:
-                    if (current_service.startswith("SC-")):
-                        passwords.append({"service": current_service.replace("SC-",""), "account": current_account})
-                    current_service, current_account = None, None
-
-            logging.info("Found %d matching generic passwords", len(passwords))
-            for password in passwords:
-                logging.info("Service: %s, Account: %s", password["service"], password["account"])
-
-            return passwords
-        except subprocess.CalledProcessError as e:
-            logging.error("Failed to list generic passwords: %s", e.stderr.strip())
+            stamp = _keychain_stamp()
+            cached = _LIST_CACHE.get(stamp) if stamp else None
+            if cached and time.monotonic() - cached[0] < _CACHE_INTERVAL:
+                passwords = cached[1]
+            else:
+                passwords = []
+                # Purely defensive: the query covers only the default keychain, where service+account is unique
+                seen = set()
+                for service, account in _keychain_attributes():
+                    key = (service, account)
+                    if not service.startswith("SC-") or key in seen:
+                        continue
+                    seen.add(key)
+                    passwords.append({"service": service[3:], "account": account})
+                _LIST_CACHE.clear()
+                if stamp:
+                    _LIST_CACHE[stamp] = (time.monotonic(), passwords)
+
+            log.info("Found %d matching generic passwords", len(passwords))
+            if passwords and log.isEnabledFor(logging.INFO):
+                # One record for the whole listing instead of one per secret
+                log.info("\n".join(f"Service: {p['service']}, Account: {p['account']}" for p in passwords))
+
+            return [dict(password) for password in passwords]
+        except KeychainError as e:
+            log.error("Failed to list generic passwords: %s", e)
             sys.exit(1)
     else:
-        logging.error("Listing generic passwords is only supported on macOS.")
+        log.error("Listing generic passwords is only supported on macOS.")
         sys.exit(1)
 
 def version():
     return "Secure Config Tool v1.0.2"
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    import argparse
+    # Default --account for every subcommand, looked up once instead of per subparser
+    default_user = getpass.getuser()
     parser = argparse.ArgumentParser(prog="secure-config",description="Tool to manage config files in OSX Keychain or from file in Linux.",epilog="WARNING: Overwrite or delete operations do not require authentication!")
     
     subparsers = parser.add_subparsers(dest='command', required=True)
@@ -140,38 +504,65 @@ def main():
     parser.add_argument("-v", "--version", action="version", version=version(), help="Show version information")
 
     list_parser = subparsers.add_parser('list', help="List all generic passwords")
-    list_parser.add_argument("-a", "--account", default=getpass.getuser(), help="Account name (default: current user)")  # updated: optional, default=current user
+    list_parser.add_argument("-a", "--account", default=default_user, help="Account name (default: current user)")  # updated: optional, default=current user
 
     load_parser = subparsers.add_parser('load', help="Load configuration")
-    load_parser.add_argument("-a", "--account", default=getpass.getuser(), help="Account name (default: current user)")  # updated: optional, default=current user
+    load_parser.add_argument("-a", "--account", default=default_user, help="Account name (default: current user)")  # updated: optional, default=current user
     load_parser.add_argument("-s", "--service", required=True, help="Service name")
-    load_parser.add_argument("-f", "--file", default="config.json", help="Configuration file (Linux only)")
-    load_parser.add_argument("--store", action="store_true", help="If set on macOS, saves loaded secret to config.json")
+    load_parser.add_argument("-f", "--file", default="config.json", help="Configuration file (Linux: read from, macOS: written by --store)")
+    load_parser.add_argument("--store", action="store_true", help="If set on macOS, saves loaded secret to --file (default: config.json)")
 
     store_parser = subparsers.add_parser('store', help="Store configuration into keychain (macOS only)")
-    store_parser.add_argument("-a", "--account", default=getpass.getuser(), help="Account name (default: current user)")  # updated: optional, default=current user
+    store_parser.add_argument("-a", "--account", default=default_user, help="Account name (default: current user)")  # updated: optional, default=current user
     store_parser.add_argument("-s", "--service", required=True, help="Service name")
     store_parser.add_argument("-f", "--file", required=True, help="Configuration file to store")
 
     delete_parser = subparsers.add_parser('delete', help="Delete a secret from keychain (macOS only)")
-    delete_parser.add_argument("-a", "--account", default=getpass.getuser(), help="Account name (default: current user)")
+    delete_parser.add_argument("-a", "--account", default=default_user, help="Account name (default: current user)")
     delete_parser.add_argument("-s", "--service", required=True, help="Service name")
 
+    batch_parser = subparsers.add_parser('batch', help="Load every service named on stdin (one per line) as JSON lines (macOS only)")
+    batch_parser.add_argument("-a", "--account", default=default_user, help="Account name (default: current user)")
+
+    return parser
+
+def batch_load(ACCOUNT_NAME, stream=None, out=None):
+    # Newline-separated service names in, one {"service": ..., "config": ...} JSON line out per service
+    if stream is None:
+        stream = sys.stdin
+    if out is None:
+        out = sys.stdout
+    services = [line.strip() for line in stream if line.strip()]
+    if not services:
+        return
+    configs = load_secure_configs(ACCOUNT_NAME, services)
+    for service in services:
+        out.write(_json_dumps({"service": service, "config": configs[service]}, pretty=False) + "\n")
+
+def main():
+    # Fast path: a bare `list` needs no argument parsing
+    if sys.argv[1:] == ["list"]:
+        list_generic_passwords()
+        return
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     if args.command == "load":
         config = load_secure_config(args.account, args.service, store=args.store, filename=args.file)
-        logging.info("Configuration loaded successfully")
-        print(json.dumps(config, indent=2))
+        log.info("Configuration loaded successfully")
+        print(_json_dumps(config))
     elif args.command == "store":
         store_secure_config(args.account, args.service, args.file)
-        logging.info("Configuration stored successfully")
+        log.info("Configuration stored successfully")
     elif args.command == "list":
         list_generic_passwords()
-        # logging.info("Configuration stored successfully")
+        # log.info("Configuration stored successfully")
     elif args.command == "delete":
         delete_secure_config(args.account, args.service)
-        logging.info("Secret deleted successfully")
+        log.info("Secret deleted successfully")
+    elif args.command == "batch":
+        batch_load(args.account)
 
 if __name__ == "__main__":
     main()